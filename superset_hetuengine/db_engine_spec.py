@@ -5,12 +5,21 @@ This module provides the database engine specification for Huawei HetuEngine,
 a Trino-based data warehouse that requires JDBC connectivity.
 """
 
+import copy
+import json
 import logging
 import re
+import sys
+import threading
+import time
+from collections import ChainMap, OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from urllib.parse import quote
 
-from sqlalchemy.engine.url import URL
+from flask import current_app, has_app_context
+from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.engine import Inspector
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.presto import PrestoEngineSpec
@@ -19,8 +28,351 @@ from superset.models.core import Database
 from superset.superset_typing import ResultSetColumnType
 from superset.sql_parse import Table
 
+from superset_hetuengine.sqlalchemy_dialect import _first_column
+
 logger = logging.getLogger(__name__)
 
+# Epoch conversion template returned by epoch_to_dttm
+_EPOCH_EXPR = sys.intern("from_unixtime({col})")
+
+
+def _format_timestamp(dttm: datetime) -> str:
+    """Render a datetime as a TIMESTAMP literal."""
+    # isoformat always yields a 19 character date and time, followed by the
+    # UTC offset for timezone-aware values, which is dropped
+    return f"TIMESTAMP '{dttm.isoformat(sep=' ', timespec='seconds')[:19]}'"
+
+
+def _format_date(dttm: datetime) -> str:
+    """Render a datetime as a DATE literal."""
+    return f"DATE '{dttm.date().isoformat()}'"
+
+
+def _format_time(dttm: datetime) -> str:
+    """Render a datetime as a TIME literal."""
+    return f"TIME '{dttm.time().isoformat(timespec='seconds')}'"
+
+
+# SQL literal formatters used by convert_dttm, keyed by upper-cased target type
+_DTTM_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "TIMESTAMP": _format_timestamp,
+    "DATETIME": _format_timestamp,
+    "DATE": _format_date,
+    "TIME": _format_time,
+}
+
+
+def _build_uri(
+    engine: str,
+    username: Any,
+    password: Any,
+    host: Any,
+    port: Any,
+    catalog: Any,
+    schema: Any,
+) -> str:
+    """
+    Build a SQLAlchemy URI, percent-encoding the credentials.
+
+    Args:
+        engine: URI scheme
+        username: Username
+        password: Password
+        host: Database host
+        port: Database port
+        catalog: Catalog name
+        schema: Schema name
+
+    Returns:
+        SQLAlchemy URI string
+    """
+    return (
+        f"{engine}://"
+        f"{quote(str(username), safe='')}:"
+        f"{quote(str(password), safe='')}@"
+        f"{host}:{port}/{catalog}/{schema}"
+    )
+
+
+# get_extra_params results per database id, with the changed_on, extra and
+# encrypted_extra they were built from
+_EXTRA_PARAMS_CACHE: Dict[Any, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+
+# Backing dictionaries for HetuEngineSpec.encryption_parameters and
+# custom_params, which expose them read-only so callers can share them without
+# copying. Change the defaults here rather than through the class attributes.
+_ENCRYPTION_PARAMETERS: Dict[str, str] = {"ssl": "true"}
+_CUSTOM_PARAMS: Dict[str, str] = {
+    "service_discovery_mode": "hsbroker",
+    "tenant": "default",
+}
+
+# Connection parameters validate_parameters requires
+_REQUIRED_PARAMETERS = ("host", "port", "username")
+_MISSING_PARAMETER_MESSAGE = "Missing required parameter: {}"
+_INVALID_PORT_MESSAGE = "Port must be a valid number"
+_MAX_PORT = 65535
+
+# Pattern used to pull the human-readable part out of a java.sql.SQLException
+_SQL_EXCEPTION_RE = re.compile(r"java\.sql\.SQLException:\s*(.+?)(?:\n|$)")
+
+# All known JDBC/Java error markers, matched in a single pass. Group names are
+# listed in _ERROR_PRIORITY in the order they take precedence.
+_ERROR_SIGNATURE_RE = re.compile(
+    r"(?P<driver_not_found>java\.lang\.ClassNotFoundException)"
+    r"|(?P<sql_exception>java\.sql\.SQLException:(?=\s*.+?(?:\n|$)))"
+    r"|(?P<jvm_not_found>JVMNotFoundException)"
+    r"|(?P<connection_refused>Connection refused)"
+    r"|(?P<service_discovery>serviceDiscoveryMode|404)"
+)
+
+_ERROR_PRIORITY: Dict[str, int] = {
+    name: index
+    for index, name in enumerate(
+        (
+            "driver_not_found",
+            "sql_exception",
+            "jvm_not_found",
+            "connection_refused",
+            "service_discovery",
+        )
+    )
+}
+
+# User-friendly messages for the markers above. The SQLException message is
+# extracted from the error itself.
+_ERROR_MESSAGES: Dict[str, str] = {
+    "driver_not_found": (
+        "JDBC driver not found. Please ensure the HetuEngine JDBC driver "
+        "JAR file is properly configured in the jar_path parameter."
+    ),
+    "jvm_not_found": (
+        "Java Virtual Machine not found. Please ensure JAVA_HOME is set "
+        "and Java is properly installed."
+    ),
+    "connection_refused": (
+        "Unable to connect to HetuEngine server. Please check the host, "
+        "port, and network connectivity."
+    ),
+    "service_discovery": (
+        "Connection failed. Please ensure serviceDiscoveryMode=hsbroker "
+        "and tenant parameters are properly configured."
+    ),
+}
+
+
+class _TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Used to avoid repeated JDBC round-trips when Superset lists the same
+    schemas, tables, views and columns many times in a short period.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        # Warmed entries per scope, kept outside the LRU so a large catalog
+        # does not evict itself. Each warm replaces the scope's previous set.
+        self._warmed: Dict[str, Tuple[float, Dict[Tuple[Any, ...], Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Optional[Tuple[Any, ...]]) -> Any:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        if key is None:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+            warmed = self._warmed.get(key[0])
+            if warmed is None:
+                return None
+            expires_at, entries = warmed
+            if expires_at < now:
+                del self._warmed[key[0]]
+                return None
+            return entries.get(key)
+
+    def set(self, key: Optional[Tuple[Any, ...]], value: Any, ttl: float) -> None:
+        """
+        Store value under key for ttl seconds, evicting the least recently used
+        entry when full.
+        """
+        if key is None:
+            return
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+
+    def replace_warmed(
+        self, scope: str, entries: Dict[Tuple[Any, ...], Any], ttl: float
+    ) -> None:
+        """
+        Replace the warmed entries of a scope, which expire together after ttl.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for other in [s for s, (exp, _) in self._warmed.items() if exp < now]:
+                del self._warmed[other]
+            # Older LRU entries for the same keys would shadow the fresh ones
+            for key in entries:
+                self._data.pop(key, None)
+            self._warmed[scope] = (now + ttl, entries)
+
+    def invalidate(self, scope: str, schema: Optional[str] = None) -> None:
+        """
+        Drop all entries for a database scope, optionally only for one schema.
+        """
+        with self._lock:
+            for key in list(self._data):
+                if key[0] == scope and (schema is None or key[2] == schema):
+                    del self._data[key]
+            if schema is None:
+                self._warmed.pop(scope, None)
+            elif scope in self._warmed:
+                expires_at, entries = self._warmed[scope]
+                self._warmed[scope] = (
+                    expires_at,
+                    {key: value for key, value in entries.items() if key[2] != schema},
+                )
+
+    def clear(self) -> None:
+        """
+        Drop all entries.
+        """
+        with self._lock:
+            self._data.clear()
+            self._warmed.clear()
+
+
+# Superset config key holding the metadata cache TTL in seconds. Superset's
+# own "force refresh" cannot bypass this cache, so it is off unless set.
+_METADATA_CACHE_TTL_CONFIG = "HETUENGINE_METADATA_CACHE_TTL"
+
+# Schema/table/view listings, keyed by (scope, kind, schema)
+_META_CACHE = _TTLCache(maxsize=256)
+
+# Column metadata, keyed by (scope, "column", schema, table). Columns are only
+# fetched when Superset asks for a specific table, so this holds one entry per
+# table actually touched and is kept apart from the listings above.
+_COLUMNS_CACHE = _TTLCache(maxsize=1024)
+
+# Lightweight information_schema projections used for metadata listings, so
+# only the names and types Superset renders are sent over JDBC
+_TABLE_NAMES_SQL = (
+    "SELECT table_name FROM information_schema.tables "
+    "WHERE table_schema = ? AND table_type = 'BASE TABLE'"
+)
+_VIEW_NAMES_SQL = (
+    "SELECT table_name FROM information_schema.tables "
+    "WHERE table_schema = ? AND table_type = 'VIEW'"
+)
+_COLUMNS_SQL = (
+    "SELECT column_name, data_type, is_nullable FROM information_schema.columns "
+    "WHERE table_schema = ? AND table_name = ? ORDER BY ordinal_position"
+)
+
+# Every table, view and column of a catalog in one round-trip, for warm_metadata
+_WARM_METADATA_SQL = (
+    "SELECT t.table_schema, t.table_name, t.table_type, "
+    "c.column_name, c.data_type, c.is_nullable "
+    "FROM information_schema.tables t "
+    "LEFT JOIN information_schema.columns c "
+    "ON c.table_schema = t.table_schema AND c.table_name = t.table_name "
+    "WHERE {condition} "
+    "ORDER BY t.table_schema, t.table_name, c.ordinal_position"
+)
+
+
+def _column_from_information_schema(
+    dialect, column_name: str, data_type: str, is_nullable: str
+) -> Dict[str, Any]:
+    """
+    Build a column dictionary from an information_schema.columns row.
+
+    Args:
+        dialect: HetuEngine dialect used to resolve the type
+        column_name: Column name
+        data_type: Column type string
+        is_nullable: "YES" or "NO"
+
+    Returns:
+        Column dictionary in the same shape as the dialect's get_columns
+    """
+    return {
+        "name": column_name,
+        "column_name": column_name,
+        "type": dialect._resolve_type(data_type),
+        "nullable": is_nullable == "YES",
+        "default": None,
+    }
+
+
+def _parse_port(port: Any) -> Optional[int]:
+    """
+    Convert a port given as an int, whole float or digit string to an int.
+
+    Args:
+        port: Port value from the connection parameters
+
+    Returns:
+        Port number, or None if it is not a valid port
+    """
+    if isinstance(port, bool):
+        return None
+    if isinstance(port, float):
+        if not port.is_integer():
+            return None
+        port = int(port)
+    elif isinstance(port, str):
+        if not (port.isascii() and port.isdigit()):
+            return None
+        port = int(port)
+    elif not isinstance(port, int):
+        return None
+    return port if 1 <= port <= _MAX_PORT else None
+
+
+def _metadata_cache_ttl() -> float:
+    """
+    Return the configured metadata cache TTL in seconds, or 0 when disabled.
+    """
+    if not has_app_context():
+        return 0
+    return current_app.config.get(_METADATA_CACHE_TTL_CONFIG) or 0
+
+
+def _metadata_scope(url: Any) -> Optional[str]:
+    """
+    Build the metadata cache scope for a SQLAlchemy URL.
+
+    Superset points the engine URL at the schema being browsed, so the schema
+    part is dropped to let every inspector on the same catalog share entries.
+
+    Args:
+        url: SQLAlchemy URL or URL string
+
+    Returns:
+        String identifying the server, user and catalog, or None if url is
+        not a URL
+    """
+    if isinstance(url, str):
+        url = make_url(url)
+    if not isinstance(url, URL):
+        return None
+    catalog = (url.database or "").split("/")[0]
+    return f"{url.drivername}://{url.username or ''}@{url.host}:{url.port}/{catalog}"
+
 
 class HetuEngineSpec(PrestoEngineSpec):
     """
@@ -42,17 +394,28 @@ class HetuEngineSpec(PrestoEngineSpec):
     )
 
     # Encryption parameters
-    encryption_parameters = {"ssl": "true"}
+    encryption_parameters = MappingProxyType(_ENCRYPTION_PARAMETERS)
 
     # Custom parameters specific to HetuEngine
-    custom_params = {
-        "service_discovery_mode": "hsbroker",
-        "tenant": "default",
-    }
+    custom_params = MappingProxyType(_CUSTOM_PARAMS)
 
     # Disable async query execution - JayDeBeApi doesn't support cursor.poll()
     run_async = False
 
+    # Catalog and schema used when none is configured
+    _DEFAULT_CATALOG = "hive"
+    _DEFAULT_SCHEMA = "default"
+
+    # JDBC connect_args read from extra/encrypted_extra, with their defaults.
+    # Keys with a ``None`` default are only set when configured.
+    _CONNECT_ARG_KEYS: Tuple[Tuple[str, Optional[str]], ...] = (
+        ("jar_path", None),
+        ("service_discovery_mode", _CUSTOM_PARAMS["service_discovery_mode"]),
+        ("tenant", _CUSTOM_PARAMS["tenant"]),
+        ("ssl", None),
+        ("ssl_verification", None),
+    )
+
     @classmethod
     def get_dbapi_exception_mapping(cls) -> Dict[Type[Exception], Type[Exception]]:
         """
@@ -68,15 +431,15 @@ class HetuEngineSpec(PrestoEngineSpec):
             Exception: exc.DatabaseError,
         }
 
-    @classmethod
-    def epoch_to_dttm(cls) -> str:
+    @staticmethod
+    def epoch_to_dttm() -> str:
         """
         Convert epoch timestamp to datetime.
 
         Returns:
             SQL expression to convert epoch to datetime
         """
-        return "from_unixtime({col})"
+        return _EPOCH_EXPR
 
     @classmethod
     def convert_dttm(
@@ -93,17 +456,36 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             SQL datetime literal string
         """
-        sqla_type = target_type.upper()
-        if sqla_type in ("TIMESTAMP", "DATETIME"):
-            return f"TIMESTAMP '{dttm.strftime('%Y-%m-%d %H:%M:%S')}'"
-        if sqla_type == "DATE":
-            return f"DATE '{dttm.strftime('%Y-%m-%d')}'"
-        if sqla_type == "TIME":
-            return f"TIME '{dttm.strftime('%H:%M:%S')}'"
-        return None
+        formatter = _DTTM_FORMATTERS.get(target_type.upper())
+        return formatter(dttm) if formatter else None
 
     @staticmethod
-    def get_extra_params(database) -> Dict[str, Any]:
+    def _load_json_dict(
+        value: Any, source: str, sensitive: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Normalize an extra/encrypted_extra value into a dictionary.
+
+        Args:
+            value: Raw value, either a dictionary or a JSON string
+            source: Name of the field, used in log messages
+            sensitive: Whether the value may hold secrets and must not be logged
+
+        Returns:
+            Parsed dictionary, or an empty dictionary if it cannot be parsed
+        """
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("Failed to parse %s as JSON", source)
+                if not sensitive and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unparsable %s: %s", source, value)
+                return {}
+        return value if isinstance(value, dict) else {}
+
+    @classmethod
+    def get_extra_params(cls, database) -> Dict[str, Any]:
         """
         Extract HetuEngine-specific parameters from database configuration.
 
@@ -113,27 +495,27 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Dictionary of extra parameters for connection
         """
-        import json
+        # Reuse the result for a saved database until it is modified again.
+        # Superset connects with new extra/encrypted_extra values before the
+        # update is flushed and changed_on moves, so the raw values are part
+        # of the fingerprint too.
+        database_id = getattr(database, "id", None)
+        changed_on = getattr(database, "changed_on", None)
+        cacheable = database_id is not None and changed_on is not None
+        if cacheable:
+            fingerprint = (changed_on, database.extra, database.encrypted_extra)
+            cached = _EXTRA_PARAMS_CACHE.get(database_id)
+            if cached and cached[0] == fingerprint:
+                return copy.deepcopy(cached[1])
 
         extra_params = PrestoEngineSpec.get_extra_params(database)
 
         # Extract HetuEngine-specific parameters from encrypted_extra or extra
         # These might be JSON strings that need to be parsed
-        encrypted_extra = database.encrypted_extra or {}
-        if isinstance(encrypted_extra, str):
-            try:
-                encrypted_extra = json.loads(encrypted_extra)
-            except (json.JSONDecodeError, TypeError):
-                logger.warning(f"Failed to parse encrypted_extra as JSON: {encrypted_extra}")
-                encrypted_extra = {}
-
-        extra = database.extra or {}
-        if isinstance(extra, str):
-            try:
-                extra = json.loads(extra)
-            except (json.JSONDecodeError, TypeError):
-                logger.warning(f"Failed to parse extra as JSON: {extra}")
-                extra = {}
+        encrypted_extra = cls._load_json_dict(
+            database.encrypted_extra or {}, "encrypted_extra", sensitive=True
+        )
+        extra = cls._load_json_dict(database.extra or {}, "extra")
 
         # Merge custom parameters
         connect_args = extra_params.get("connect_args", {})
@@ -141,81 +523,34 @@ class HetuEngineSpec(PrestoEngineSpec):
         # Check if connect_args are nested in extra or encrypted_extra
         # This handles the case where users configure:
         # {"connect_args": {"jar_path": "...", "service_discovery_mode": "..."}}
-        encrypted_extra_connect_args = {}
-        if isinstance(encrypted_extra, dict) and "connect_args" in encrypted_extra:
-            encrypted_extra_connect_args = encrypted_extra.get("connect_args", {})
-            if isinstance(encrypted_extra_connect_args, str):
-                try:
-                    encrypted_extra_connect_args = json.loads(encrypted_extra_connect_args)
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(f"Failed to parse connect_args from encrypted_extra: {encrypted_extra_connect_args}")
-                    encrypted_extra_connect_args = {}
-
-        extra_connect_args = {}
-        if isinstance(extra, dict) and "connect_args" in extra:
-            extra_connect_args = extra.get("connect_args", {})
-            if isinstance(extra_connect_args, str):
-                try:
-                    extra_connect_args = json.loads(extra_connect_args)
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(f"Failed to parse connect_args from extra: {extra_connect_args}")
-                    extra_connect_args = {}
-
-        # Add JDBC-specific parameters
         # Priority: encrypted_extra.connect_args > extra.connect_args > encrypted_extra > extra
-        if "jar_path" in encrypted_extra_connect_args:
-            connect_args["jar_path"] = encrypted_extra_connect_args["jar_path"]
-        elif "jar_path" in extra_connect_args:
-            connect_args["jar_path"] = extra_connect_args["jar_path"]
-        elif "jar_path" in encrypted_extra:
-            connect_args["jar_path"] = encrypted_extra["jar_path"]
-        elif "jar_path" in extra:
-            connect_args["jar_path"] = extra["jar_path"]
-
-        # Add HetuEngine-specific parameters
-        if "service_discovery_mode" in encrypted_extra_connect_args:
-            connect_args["service_discovery_mode"] = encrypted_extra_connect_args["service_discovery_mode"]
-        elif "service_discovery_mode" in extra_connect_args:
-            connect_args["service_discovery_mode"] = extra_connect_args["service_discovery_mode"]
-        elif "service_discovery_mode" in encrypted_extra:
-            connect_args["service_discovery_mode"] = encrypted_extra["service_discovery_mode"]
-        elif "service_discovery_mode" in extra:
-            connect_args["service_discovery_mode"] = extra["service_discovery_mode"]
-        else:
-            connect_args["service_discovery_mode"] = "hsbroker"
-
-        if "tenant" in encrypted_extra_connect_args:
-            connect_args["tenant"] = encrypted_extra_connect_args["tenant"]
-        elif "tenant" in extra_connect_args:
-            connect_args["tenant"] = extra_connect_args["tenant"]
-        elif "tenant" in encrypted_extra:
-            connect_args["tenant"] = encrypted_extra["tenant"]
-        elif "tenant" in extra:
-            connect_args["tenant"] = extra["tenant"]
-        else:
-            connect_args["tenant"] = "default"
-
-        # SSL parameters
-        if "ssl" in encrypted_extra_connect_args:
-            connect_args["ssl"] = encrypted_extra_connect_args["ssl"]
-        elif "ssl" in extra_connect_args:
-            connect_args["ssl"] = extra_connect_args["ssl"]
-        elif "ssl" in encrypted_extra:
-            connect_args["ssl"] = encrypted_extra["ssl"]
-        elif "ssl" in extra:
-            connect_args["ssl"] = extra["ssl"]
-
-        if "ssl_verification" in encrypted_extra_connect_args:
-            connect_args["ssl_verification"] = encrypted_extra_connect_args["ssl_verification"]
-        elif "ssl_verification" in extra_connect_args:
-            connect_args["ssl_verification"] = extra_connect_args["ssl_verification"]
-        elif "ssl_verification" in encrypted_extra:
-            connect_args["ssl_verification"] = encrypted_extra["ssl_verification"]
-        elif "ssl_verification" in extra:
-            connect_args["ssl_verification"] = extra["ssl_verification"]
+        merged = ChainMap(
+            cls._load_json_dict(
+                encrypted_extra.get("connect_args", {}),
+                "connect_args from encrypted_extra",
+                sensitive=True,
+            ),
+            cls._load_json_dict(
+                extra.get("connect_args", {}), "connect_args from extra"
+            ),
+            encrypted_extra,
+            extra,
+        )
+
+        for key, default in cls._CONNECT_ARG_KEYS:
+            value = merged.get(key, default)
+            if value is not None:
+                connect_args[key] = value
 
         extra_params["connect_args"] = connect_args
 
+        if cacheable:
+            # Callers may mutate connect_args, so the cache keeps its own copy
+            _EXTRA_PARAMS_CACHE[database_id] = (
+                copy.deepcopy(fingerprint),
+                copy.deepcopy(extra_params),
+            )
+
         return extra_params
 
     @classmethod
@@ -234,20 +569,77 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             SQLAlchemy URI string
         """
-        query_params = parameters.get("query", {})
-
-        # Build base URI
-        uri = (
-            f"{cls.engine}://"
-            f"{parameters.get('username', '')}:"
-            f"{parameters.get('password', '')}@"
-            f"{parameters.get('host', 'localhost')}:"
-            f"{parameters.get('port', 29860)}/"
-            f"{parameters.get('catalog', 'hive')}/"
-            f"{parameters.get('schema', 'default')}"
+        return _build_uri(
+            cls.engine,
+            parameters.get("username", ""),
+            parameters.get("password", ""),
+            parameters.get("host", "localhost"),
+            parameters.get("port", 29860),
+            parameters.get("catalog", cls._DEFAULT_CATALOG),
+            parameters.get("schema", cls._DEFAULT_SCHEMA),
         )
 
-        return uri
+    @classmethod
+    def _safe_inspect(cls, what: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call an inspector method, logging and swallowing any error.
+
+        Args:
+            what: Description of the metadata, used in the log message
+            fn: Inspector method to call
+            *args: Arguments for the method
+
+        Returns:
+            Result of the call, or None if it raised
+        """
+        try:
+            return fn(*args)
+        except Exception as e:
+            logger.error("Error getting %s: %s", what, e)
+            return None
+
+    @classmethod
+    def _metadata_cache_key(
+        cls, inspector, *parts: Optional[str]
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the metadata cache key for an inspector.
+
+        Args:
+            inspector: SQLAlchemy inspector
+            *parts: Kind of metadata followed by schema (and table) names
+
+        Returns:
+            Cache key, or None if caching is disabled or the inspector is not
+            bound to an engine URL
+        """
+        if _metadata_cache_ttl() <= 0:
+            return None
+        url = getattr(getattr(inspector, "bind", None), "url", None)
+        scope = _metadata_scope(url)
+        if scope is None:
+            return None
+        return (scope, *parts)
+
+    @classmethod
+    def invalidate_metadata(
+        cls, db_url: Union[URL, str], schema: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached schema, table, view and column metadata for a database.
+
+        Call this after DDL so the next listing reflects the change without
+        waiting for the cache entries to expire.
+
+        Args:
+            db_url: SQLAlchemy URL of the database
+            schema: Only invalidate this schema if given
+        """
+        scope = _metadata_scope(db_url)
+        if scope is None:
+            return
+        _META_CACHE.invalidate(scope, schema)
+        _COLUMNS_CACHE.invalidate(scope, schema)
 
     @classmethod
     def get_schema_names(cls, inspector) -> set[str]:
@@ -260,12 +652,91 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Set of schema names
         """
-        try:
-            return set(inspector.get_schema_names())
-        except Exception as e:
-            logger.error(f"Error getting schema names: {e}")
+        key = cls._metadata_cache_key(inspector, "schema", None)
+        cached = _META_CACHE.get(key)
+        if cached is not None:
+            return set(cached)
+
+        schemas = cls._safe_inspect("schema names", inspector.get_schema_names)
+        if schemas is None:
             return set()
 
+        _META_CACHE.set(key, frozenset(schemas), _metadata_cache_ttl())
+        return set(schemas)
+
+    @classmethod
+    def _query_information_schema(
+        cls, inspector, sql: str, *params: Any
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Run a metadata query on the inspector's engine.
+
+        Args:
+            inspector: SQLAlchemy inspector
+            sql: Query using qmark placeholders
+            *params: Query parameters
+
+        Returns:
+            List of result rows
+        """
+        with inspector.bind.connect() as connection:
+            return connection.exec_driver_sql(sql, params).fetchall()
+
+    @classmethod
+    def _get_relation_names(
+        cls,
+        inspector,
+        schema: Optional[str],
+        kind: str,
+        sql: str,
+        fallback: Callable[[Optional[str]], List[str]],
+    ) -> set[str]:
+        """
+        Get table or view names, preferring a projected information_schema query.
+
+        Args:
+            inspector: SQLAlchemy inspector
+            schema: Schema name
+            kind: Either "table" or "view"
+            sql: information_schema query returning only the names
+            fallback: Inspector method used when the query fails or is empty
+
+        Returns:
+            Set of table or view names
+        """
+        key = cls._metadata_cache_key(inspector, kind, schema)
+        cached = _META_CACHE.get(key)
+        if cached is not None:
+            return set(cached)
+
+        names: Optional[set[str]] = None
+        if schema:
+            try:
+                names = set(
+                    map(
+                        _first_column,
+                        cls._query_information_schema(inspector, sql, schema),
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    "information_schema lookup of %s names failed, "
+                    "falling back to inspector: %s",
+                    kind,
+                    e,
+                )
+
+        # An empty result may just be a schema passed in a different case,
+        # which information_schema matches exactly, so ask the inspector too
+        if not names:
+            fallback_names = cls._safe_inspect(f"{kind} names", fallback, schema)
+            if fallback_names is None:
+                return set()
+            names = set(fallback_names)
+
+        _META_CACHE.set(key, frozenset(names), _metadata_cache_ttl())
+        return names
+
     @classmethod
     def get_table_names(
         cls, database, inspector, schema: Optional[str]
@@ -273,6 +744,9 @@ class HetuEngineSpec(PrestoEngineSpec):
         """
         Get list of table names from schema.
 
+        Only table names are projected from information_schema; the inspector
+        is used when no schema is given or the query fails or returns nothing.
+
         Args:
             database: Superset database object
             inspector: SQLAlchemy inspector
@@ -281,11 +755,9 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Set of table names
         """
-        try:
-            return set(inspector.get_table_names(schema))
-        except Exception as e:
-            logger.error(f"Error getting table names: {e}")
-            return set()
+        return cls._get_relation_names(
+            inspector, schema, "table", _TABLE_NAMES_SQL, inspector.get_table_names
+        )
 
     @classmethod
     def get_view_names(
@@ -294,6 +766,9 @@ class HetuEngineSpec(PrestoEngineSpec):
         """
         Get list of view names from schema.
 
+        Only view names are projected from information_schema; the inspector
+        is used when no schema is given or the query fails or returns nothing.
+
         Args:
             database: Superset database object
             inspector: SQLAlchemy inspector
@@ -302,11 +777,9 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Set of view names
         """
-        try:
-            return set(inspector.get_view_names(schema))
-        except Exception as e:
-            logger.error(f"Error getting view names: {e}")
-            return set()
+        return cls._get_relation_names(
+            inspector, schema, "view", _VIEW_NAMES_SQL, inspector.get_view_names
+        )
 
     @classmethod
     def get_columns(
@@ -318,6 +791,10 @@ class HetuEngineSpec(PrestoEngineSpec):
         """
         Get column information for a table.
 
+        Only column name, type and nullability are projected from
+        information_schema; the inspector is used when no schema is given or
+        the query returns nothing.
+
         Args:
             inspector: SQLAlchemy inspector
             table: Table instance
@@ -326,11 +803,124 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             List of column dictionaries
         """
+        key = cls._metadata_cache_key(
+            inspector, "column", table.schema, table.table
+        )
+        cached = _COLUMNS_CACHE.get(key)
+        if cached is not None:
+            return [dict(column) for column in cached]  # type: ignore[misc]
+
+        columns: List[Any] = []
+        if table.schema:
+            try:
+                rows = cls._query_information_schema(
+                    inspector, _COLUMNS_SQL, table.schema, table.table
+                )
+                columns = [
+                    _column_from_information_schema(inspector.dialect, *row)
+                    for row in rows
+                ]
+            except Exception as e:
+                logger.warning(
+                    "information_schema lookup of columns failed, "
+                    "falling back to inspector: %s",
+                    e,
+                )
+
+        if not columns:
+            columns = cls._safe_inspect(
+                "columns", inspector.get_columns, table.table, table.schema
+            )
+            if columns is None:
+                return []
+
+        _COLUMNS_CACHE.set(
+            key, tuple(dict(column) for column in columns), _metadata_cache_ttl()
+        )
+        return columns
+
+    @classmethod
+    def warm_metadata(
+        cls, database: Database, schemas: Optional[List[str]] = None
+    ) -> None:
+        """
+        Prime the metadata caches with a single information_schema query.
+
+        Fetches every table, view and column of the given schemas (or of the
+        whole catalog) in one round-trip, so the following get_table_names,
+        get_view_names and get_columns calls are served from the cache instead
+        of issuing one query per schema and per table. The result replaces
+        anything warmed earlier for the same database and is not subject to
+        the caches' size limits. Superset does not call this itself; it can be
+        invoked after connecting to a database. Does nothing unless the
+        metadata cache is enabled.
+
+        Args:
+            database: Superset database object
+            schemas: Schemas to load, or None for all schemas of the catalog
+        """
+        ttl = _metadata_cache_ttl()
+        if ttl <= 0:
+            logger.warning(
+                "Not warming metadata: %s is not set", _METADATA_CACHE_TTL_CONFIG
+            )
+            return
+
+        if schemas:
+            condition = "t.table_schema IN ({})".format(", ".join("?" * len(schemas)))
+            params: Tuple[str, ...] = tuple(schemas)
+        else:
+            condition = "t.table_schema <> 'information_schema'"
+            params = ()
+
         try:
-            return inspector.get_columns(table.table, table.schema)
+            with database.get_sqla_engine() as engine:
+                with engine.connect() as connection:
+                    rows = connection.exec_driver_sql(
+                        _WARM_METADATA_SQL.format(condition=condition), params
+                    ).fetchall()
+                scope = _metadata_scope(engine.url)
+                dialect = engine.dialect
         except Exception as e:
-            logger.error(f"Error getting columns: {e}")
-            return []
+            logger.warning("Error warming metadata cache: %s", e)
+            return
+        if scope is None:
+            return
+
+        tables: Dict[str, set[str]] = {}
+        views: Dict[str, set[str]] = {}
+        columns: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for schema, table_name, table_type, *column in rows:
+            tables.setdefault(schema, set())
+            views.setdefault(schema, set())
+            if table_type == "BASE TABLE":
+                tables[schema].add(table_name)
+            elif table_type == "VIEW":
+                views[schema].add(table_name)
+            table_columns = columns.setdefault((schema, table_name), [])
+            if column[0] is not None:
+                table_columns.append(
+                    _column_from_information_schema(dialect, *column)
+                )
+
+        # Empty listings are left out, so lookups fall back to the inspector
+        # as they do for an empty information_schema result
+        listings: Dict[Tuple[Any, ...], Any] = {}
+        for schema in tables:
+            if tables[schema]:
+                listings[(scope, "table", schema)] = frozenset(tables[schema])
+            if views[schema]:
+                listings[(scope, "view", schema)] = frozenset(views[schema])
+        _META_CACHE.replace_warmed(scope, listings, ttl)
+        _COLUMNS_CACHE.replace_warmed(
+            scope,
+            {
+                (scope, "column", schema, table_name): tuple(table_columns)
+                for (schema, table_name), table_columns in columns.items()
+                if table_columns
+            },
+            ttl,
+        )
 
     @classmethod
     def extract_error_message(cls, ex: Exception) -> str:
@@ -345,36 +935,24 @@ class HetuEngineSpec(PrestoEngineSpec):
         """
         error_str = str(ex)
 
-        # Check for common JDBC/Java errors
-        if "java.lang.ClassNotFoundException" in error_str:
-            return (
-                "JDBC driver not found. Please ensure the HetuEngine JDBC driver "
-                "JAR file is properly configured in the jar_path parameter."
-            )
-
-        if "java.sql.SQLException" in error_str:
+        # Check for common JDBC/Java errors in a single scan, keeping the
+        # marker with the highest priority
+        signature: Optional[str] = None
+        for match in _ERROR_SIGNATURE_RE.finditer(error_str):
+            name = match.lastgroup
+            rank = _ERROR_PRIORITY[name]
+            if signature is None or rank < _ERROR_PRIORITY[signature]:
+                signature = name
+                if rank == 0:
+                    break
+
+        if signature == "sql_exception":
             # Extract SQL exception message
-            match = re.search(r"java\.sql\.SQLException:\s*(.+?)(?:\n|$)", error_str)
+            match = _SQL_EXCEPTION_RE.search(error_str)
             if match:
                 return f"Database error: {match.group(1)}"
-
-        if "JVMNotFoundException" in error_str:
-            return (
-                "Java Virtual Machine not found. Please ensure JAVA_HOME is set "
-                "and Java is properly installed."
-            )
-
-        if "Connection refused" in error_str:
-            return (
-                "Unable to connect to HetuEngine server. Please check the host, "
-                "port, and network connectivity."
-            )
-
-        if "serviceDiscoveryMode" in error_str or "404" in error_str:
-            return (
-                "Connection failed. Please ensure serviceDiscoveryMode=hsbroker "
-                "and tenant parameters are properly configured."
-            )
+        elif signature is not None:
+            return _ERROR_MESSAGES[signature]
 
         # Return original message if no specific pattern matched
         return super().extract_error_message(ex)
@@ -386,6 +964,8 @@ class HetuEngineSpec(PrestoEngineSpec):
         """
         Validate connection parameters before attempting connection.
 
+        A valid port is normalized to an int in parameters.
+
         Args:
             parameters: Connection parameters
 
@@ -395,29 +975,32 @@ class HetuEngineSpec(PrestoEngineSpec):
         errors: List[SupersetError] = []
 
         # Validate required parameters
-        required = ["host", "port", "username"]
-        for param in required:
+        for param in _REQUIRED_PARAMETERS:
             if not parameters.get(param):
                 errors.append(
                     SupersetError(
-                        message=f"Missing required parameter: {param}",
+                        message=_MISSING_PARAMETER_MESSAGE.format(param),
                         error_type=SupersetErrorType.CONNECTION_MISSING_PARAMETERS_ERROR,
                         level=ErrorLevel.ERROR,
                         extra={"missing": [param]},
                     )
                 )
 
-        # Validate port is numeric
+        # Validate port is numeric and in range, and store it back as an int
         port = parameters.get("port")
-        if port and not str(port).isdigit():
-            errors.append(
-                SupersetError(
-                    message="Port must be a valid number",
-                    error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
-                    level=ErrorLevel.ERROR,
-                    extra={"port": port},
+        if port:
+            port_number = _parse_port(port)
+            if port_number is None:
+                errors.append(
+                    SupersetError(
+                        message=_INVALID_PORT_MESSAGE,
+                        error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
+                        level=ErrorLevel.ERROR,
+                        extra={"port": port},
+                    )
                 )
-            )
+            else:
+                parameters["port"] = port_number
 
         return errors
 
@@ -432,7 +1015,7 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Default catalog name (typically 'hive')
         """
-        return "hive"
+        return cls._DEFAULT_CATALOG
 
     @classmethod
     def get_default_schema(
@@ -448,7 +1031,7 @@ class HetuEngineSpec(PrestoEngineSpec):
         Returns:
             Default schema name (typically 'default')
         """
-        return "default"
+        return cls._DEFAULT_SCHEMA
 
     @classmethod
     def get_create_view(
@@ -31,7 +31,7 @@ def check_java_installation() -> Tuple[bool, Optional[str]]:
         version_output = result.stderr or result.stdout
         return True, version_output.split("\n")[0] if version_output else None
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        logger.warning(f"Java check failed: {e}")
+        logger.warning("Java check failed: %s", e)
         return False, None
 
 
@@ -321,5 +321,5 @@ def test_jdbc_connection(
             return False, "Connection test query failed"
 
     except Exception as e:
-        logger.error(f"Connection test failed: {e}", exc_info=True)
+        logger.error("Connection test failed: %s", e, exc_info=True)
         return False, format_error_message(e)
@@ -11,39 +11,18 @@ Note: We create a minimal Flask app with Superset's configuration WITHOUT
 full initialization to avoid complex dependencies and marshmallow compatibility issues.
 """
 
+import importlib
 import os
-import pytest
 from collections.abc import Iterator
-from flask import Flask
-
-
-# NOTE: We must set up the Superset extensions BEFORE importing any Superset models
-# because they use them at module-import time. We need to initialize them early.
-
-# Initialize event logger IMMEDIATELY (before any Superset models are imported)
-import superset.extensions
-from superset.utils.log import AbstractEventLogger
-
-class DummyEventLogger(AbstractEventLogger):
-    """Dummy event logger for testing that doesn't do anything."""
-    def log(self, *args, **kwargs):
-        """No-op log method."""
-        pass
-
-    def log_this(self, f):
-        """No-op decorator."""
-        return f
+from typing import Optional
+from unittest.mock import MagicMock
 
-# Replace the None event_logger with our dummy before any models import
-superset.extensions.event_logger = DummyEventLogger()
+import pytest
+from flask import Flask
 
-# Also need to initialize security_manager as a dummy
-from unittest.mock import MagicMock
-superset.extensions.security_manager = MagicMock()
+_test_app: Optional[Flask] = None
 
 
-# Create and configure Flask application at module import time
-# This is necessary because Superset modules require app context during import
 def _create_test_app() -> Flask:
     """
     Create a minimal Flask application with Superset configuration for testing.
@@ -79,15 +58,62 @@ def _create_test_app() -> Flask:
     return app
 
 
-# Create the app IMMEDIATELY at module import time, before anything else
-# This allows the encrypted_field_factory to be initialized before Superset models import
-_test_app = _create_test_app()
+def _bootstrap_superset() -> Flask:
+    """
+    Initialize the Superset singletons and app context once per process.
+
+    Superset models use the event logger, security manager and encrypted field
+    factory at module-import time, so this must run before any test module
+    imports the HetuEngine connector. It is idempotent, so each pytest-xdist
+    worker pays the cost exactly once.
+
+    Returns:
+        Flask: The test Flask application instance
+    """
+    global _test_app
+    if _test_app is not None:
+        return _test_app
+
+    extensions = importlib.import_module("superset.extensions")
+    log = importlib.import_module("superset.utils.log")
+
+    class DummyEventLogger(log.AbstractEventLogger):
+        """Dummy event logger for testing that doesn't do anything."""
+
+        def log(self, *args, **kwargs):
+            """No-op log method."""
+            pass
+
+        def log_this(self, f):
+            """No-op decorator."""
+            return f
+
+    # Replace the None event_logger with our dummy before any models import
+    extensions.event_logger = DummyEventLogger()
+
+    # Also need to initialize security_manager as a dummy. Newer Superset
+    # versions import it as a proxy to appbuilder.sm, so set both.
+    extensions.security_manager = MagicMock()
+    extensions.appbuilder.sm = MagicMock()
+
+    # Push the app context BEFORE any test files are imported
+    # This is crucial because test files will import our HetuEngine modules,
+    # which in turn import Superset modules that need the app context
+    app = _create_test_app()
+    app.app_context().push()
+
+    _test_app = app
+    return app
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Bootstrap Superset before collection.
 
-# Push the app context BEFORE any test files are imported
-# This is crucial because test files will import our HetuEngine modules,
-# which in turn import Superset modules that need the app context
-_app_context = _test_app.app_context()
-_app_context.push()
+    Test modules import the HetuEngine connector at import time, so this
+    has to happen before any fixture runs.
+    """
+    _bootstrap_superset()
 
 
 @pytest.fixture(scope="session")
@@ -95,13 +121,12 @@ def app() -> Flask:
     """
     Provide the Flask application instance for tests.
 
-    This fixture provides access to the Flask app that was created
-    and configured at module import time.
+    Returns the Flask app already created by pytest_configure.
 
     Returns:
         Flask: The test Flask application instance
     """
-    return _test_app
+    return _bootstrap_superset()
 
 
 @pytest.fixture